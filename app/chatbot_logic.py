@@ -1,9 +1,28 @@
+import collections
+import concurrent.futures
+import dataclasses
+import functools
 import json
+import logging
 import random
 import re
-from fuzzywuzzy import fuzz, process
+import string
+import numpy as np
+from rapidfuzz import fuzz, process, utils
 from pathlib import Path
 
+# orjson parses the data files several times faster than stdlib json, but
+# keep it optional so the bot still runs where it isn't installed
+try:
+    import orjson
+
+    def _load_json_file(path):
+        return orjson.loads(path.read_bytes())
+except ImportError:
+    def _load_json_file(path):
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
 # Determine the data directory robustly. The repository stores JSON under either
 # "Data" or "data" at the project root; try both so the code works on case-
 # sensitive filesystems as well as Windows.
@@ -19,36 +38,279 @@ for p in _CANDIDATES:
 if DATA_DIR is None:
     raise FileNotFoundError(f"Could not find a data directory. Tried: {', '.join(str(p) for p in _CANDIDATES)}")
 
-# Load all JSON files once
-def load_data():
-    data = {}
+# The five data files, in the order their mtimes form the cache key below
+_DATA_FILES = ("menu.json", "faq.json", "about.json", "branches.json", "hours.json")
+
+# Last successfully loaded data, served if the files become unreadable
+_LAST_GOOD = None
+
+_MISSING = object()
+
+# Typed records built once at load time. The JSON structure is fixed, so the
+# per-request isinstance/"key in dict" guards the handlers used to run on
+# every message are paid a single time here instead; malformed entries are
+# dropped with a warning. slots=True keeps the objects smaller than dicts.
+
+@dataclasses.dataclass(slots=True)
+class Variant:
+    size: str
+    price: float = 0
+
+@dataclasses.dataclass(slots=True)
+class Flavour:
+    name: str
+    extra: float = 0
+
+@dataclasses.dataclass(slots=True)
+class Addon:
+    name: str
+    price: float = 0
+
+@dataclasses.dataclass(slots=True)
+class MenuItem:
+    name: str
+    description: str = ""
+    base_price: float = None
+    variants: list = dataclasses.field(default_factory=list)
+    flavours: list = dataclasses.field(default_factory=list)
+    addons: list = dataclasses.field(default_factory=list)
+
+@dataclasses.dataclass(slots=True)
+class Branch:
+    name: str = "Unknown"
+    city: str = ""
+    address: str = "Not available"
+    phone: str = "Not available"
+
+@dataclasses.dataclass(slots=True)
+class HoursEntry:
+    branch_name: str = "Branch"
+    regular: dict = dataclasses.field(default_factory=dict)
+    special_notes: str = ""
+
+@dataclasses.dataclass(slots=True)
+class FAQ:
+    question: str
+    answer: str = ""
+
+def _parse_menu(raw_menu):
+    """Convert raw menu JSON into {category: [MenuItem, ...]}. Idempotent."""
+    menu = {}
+    for category, items in raw_menu.items():
+        if not isinstance(items, list):
+            logging.warning("menu.json: category %r is not a list; dropped", category)
+            continue
+        parsed = []
+        for item in items:
+            if isinstance(item, MenuItem):
+                parsed.append(item)
+                continue
+            if not isinstance(item, dict) or "name" not in item:
+                logging.warning("menu.json: malformed item in %r dropped: %r", category, item)
+                continue
+            raw_variants = item.get("variants")
+            variants = [Variant(size=v["size"], price=v.get("price", 0))
+                        for v in (raw_variants if isinstance(raw_variants, list) else [])
+                        if isinstance(v, dict) and "size" in v]
+            raw_flavours = item.get("flavours")
+            flavours = []
+            for f in (raw_flavours if isinstance(raw_flavours, list) else []):
+                if isinstance(f, dict) and "name" in f:
+                    flavours.append(Flavour(name=f["name"], extra=f.get("extra", 0)))
+                elif isinstance(f, str):
+                    flavours.append(Flavour(name=f))
+            raw_addons = item.get("addons")
+            addons = [Addon(name=a["name"], price=a["price"])
+                      for a in (raw_addons if isinstance(raw_addons, list) else [])
+                      if isinstance(a, dict) and "name" in a and "price" in a]
+            parsed.append(MenuItem(name=item["name"],
+                                   description=item.get("description", ""),
+                                   base_price=item.get("base_price"),
+                                   variants=variants,
+                                   flavours=flavours,
+                                   addons=addons))
+        menu[category] = parsed
+    return menu
+
+def _parse_branches(raw_branches):
+    branches = []
+    for b in raw_branches:
+        if isinstance(b, Branch):
+            branches.append(b)
+        elif isinstance(b, dict):
+            branches.append(Branch(name=b.get("name", "Unknown"),
+                                   city=b.get("city", ""),
+                                   address=b.get("address", "Not available"),
+                                   phone=b.get("phone", "Not available")))
+        else:
+            logging.warning("branches.json: malformed entry dropped: %r", b)
+    return branches
+
+def _parse_hours(raw_hours):
+    hours = []
+    for h in raw_hours:
+        if isinstance(h, HoursEntry):
+            hours.append(h)
+        elif isinstance(h, dict):
+            regular = h.get("regular", {})
+            hours.append(HoursEntry(branch_name=h.get("branch_name", "Branch"),
+                                    regular=regular if isinstance(regular, dict) else {},
+                                    special_notes=h.get("special_notes", "")))
+        else:
+            logging.warning("hours.json: malformed entry dropped: %r", h)
+    return hours
+
+def _parse_faqs(raw_faqs):
+    faqs = []
+    for q in raw_faqs:
+        if isinstance(q, FAQ):
+            faqs.append(q)
+        elif isinstance(q, dict) and "question" in q:
+            faqs.append(FAQ(question=q["question"], answer=q.get("answer", "")))
+        else:
+            logging.warning("faq.json: malformed entry dropped: %r", q)
+    return faqs
+
+class ChatData:
+    """Lazily parsed view of the data files.
+
+    Each section is read and parsed on first access via cached_property, so
+    a session that only asks menu questions never touches the other files.
+    get() and [] are provided so the existing dict-style handler code keeps
+    working unchanged.
+    """
+
     # Load menu.json - structure: {"restaurant": "...", "currency": "...", "menu": {...}}
-    with (DATA_DIR / "menu.json").open("r", encoding="utf-8") as f:
-        menu_json = json.load(f)
-        # Extract the menu object (it's nested under "menu" key)
-        data["menu"] = menu_json.get("menu", menu_json)
-        data["restaurant_name"] = menu_json.get("restaurant", "Restaurant")
-        data["currency"] = menu_json.get("currency", "PKR")
+    @functools.cached_property
+    def _menu_json(self):
+        return _load_json_file(DATA_DIR / "menu.json")
+
+    @functools.cached_property
+    def menu(self):
+        # Extract the menu object (it's nested under "menu" key) and convert
+        # it to typed MenuItem records
+        return _parse_menu(self._menu_json.get("menu", self._menu_json))
+
+    @functools.cached_property
+    def restaurant_name(self):
+        return self._menu_json.get("restaurant", "Restaurant")
+
+    @functools.cached_property
+    def currency(self):
+        return self._menu_json.get("currency", "PKR")
 
     # Load faq.json - structure: {"faqs": [...]}
-    with (DATA_DIR / "faq.json").open("r", encoding="utf-8") as f:
-        faq_json = json.load(f)
-        data["faq"] = faq_json.get("faqs", [])
+    @functools.cached_property
+    def faq(self):
+        return _parse_faqs(_load_json_file(DATA_DIR / "faq.json").get("faqs", []))
 
     # Load about.json - structure: {"id": "...", "name": "...", "mission": "...", etc.}
-    with (DATA_DIR / "about.json").open("r", encoding="utf-8") as f:
-        data["about"] = json.load(f)
+    @functools.cached_property
+    def about(self):
+        return _load_json_file(DATA_DIR / "about.json")
 
     # Load branches.json - structure: {"branches": [...]}
-    with (DATA_DIR / "branches.json").open("r", encoding="utf-8") as f:
-        branches_json = json.load(f)
-        data["branches"] = branches_json.get("branches", [])
+    @functools.cached_property
+    def branches(self):
+        return _parse_branches(_load_json_file(DATA_DIR / "branches.json").get("branches", []))
 
     # Load hours.json - structure: {"hours": [...]}
-    with (DATA_DIR / "hours.json").open("r", encoding="utf-8") as f:
-        hours_json = json.load(f)
-        data["hours"] = hours_json.get("hours", [])
+    @functools.cached_property
+    def hours(self):
+        return _parse_hours(_load_json_file(DATA_DIR / "hours.json").get("hours", []))
+
+    # Fuzzy-search index so search_menu doesn't rebuild it on every message
+    @functools.cached_property
+    def menu_index(self):
+        return _build_menu_index(self.menu)
+
+    # Pre-rendered full-menu response; the mtime-keyed cache below keeps it
+    # in sync with menu.json
+    @functools.cached_property
+    def full_menu_rendered(self):
+        return _render_full_menu(self.menu, self.currency)
+
+    # Pre-rendered popular-items fallback, likewise deterministic
+    @functools.cached_property
+    def popular_items_rendered(self):
+        return _render_popular_items(self.menu, self.currency)
+
+    # Pre-rendered opening-hours response; depends only on hours.json
+    @functools.cached_property
+    def hours_rendered(self):
+        return _render_hours(self.hours)
+
+    # Item name (lowercased) -> pre-rendered detail card for every menu item
+    @functools.cached_property
+    def item_details_rendered(self):
+        details = {}
+        for items in self.menu.values():
+            for item in items:
+                details[item.name.lower()] = _render_item_detail(item, self.currency)
+        return details
+
+    # Sections warm() reads in parallel, plus the derived caches it builds
+    # afterwards so the first user request hits fully prepared data
+    _SECTIONS = ("menu", "faq", "about", "branches", "hours")
+    _DERIVED = ("menu_index", "full_menu_rendered", "popular_items_rendered",
+                "hours_rendered", "item_details_rendered")
+
+    def warm(self):
+        """Parse every data file up front, overlapping the reads.
+
+        Lazy loading is right for CLI/test use, but a server should pay the
+        cost at startup rather than on the first request. The five files are
+        independent, so reading them in a thread pool overlaps the I/O; the
+        derived caches are then built on the parsed data.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self._SECTIONS)) as ex:
+            list(ex.map(functools.partial(getattr, self), self._SECTIONS))
+        for name in self._DERIVED:
+            getattr(self, name)
+        return self
+
+    # Dict-style access for the handlers
+    def get(self, key, default=None):
+        value = getattr(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        return value
 
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+# Build the lazy data view; cached on the mtime tuple so a fresh view (and
+# therefore a reparse on next access) only happens when a file changes on disk
+@functools.lru_cache(maxsize=1)
+def _load_data_cached(version):
+    return ChatData()
+
+def load_data():
+    """Return the parsed data files, reloading only when one changes on disk.
+
+    Stats the five files and uses the mtime tuple as the cache key for
+    _load_data_cached, so steady-state calls skip all file I/O and JSON
+    parsing. Every section is touched here, inside the try, so a corrupted
+    or mid-rewrite file fails now rather than at first handler access; in
+    that case the last good snapshot is served instead. The getattr loop is
+    free once a view has parsed (cached_property), and only the file parsing
+    is forced - the derived caches stay lazy.
+    """
+    global _LAST_GOOD
+    try:
+        version = tuple((DATA_DIR / name).stat().st_mtime_ns for name in _DATA_FILES)
+        data = _load_data_cached(version)
+        for name in ChatData._SECTIONS:
+            getattr(data, name)
+    except (OSError, ValueError):
+        # json/orjson decode errors both subclass ValueError
+        if _LAST_GOOD is not None:
+            return _LAST_GOOD
+        raise
+    _LAST_GOOD = data
     return data
 
 # Predefined responses
@@ -60,6 +322,11 @@ greetings = [
 farewells = ["Bye! Have a great day!", "See you soon!", "Thanks for visiting Speedy Bites!"]
 fallback = "Sorry, I didn't understand that. I can help with menu, timings, branches, or FAQs. 😊"
 
+# Phrases that mean the user wants the whole menu; module-level so the
+# tuple isn't rebuilt on every message
+_FULL_MENU_PHRASES = ("full menu", "all menu", "complete menu", "entire menu",
+                      "show all", "all dishes", "all items")
+
 # Synonym dictionary for better NLP understanding
 SYNONYMS = {
     # Menu related
@@ -125,208 +392,499 @@ INTENT_KEYWORDS = {
     ]
 }
 
+# Flattened keyword arrays so intent scoring can run as one vectorized
+# rapidfuzz.process.cdist call instead of nested Python loops (see
+# calculate_intent_scores).
+_INTENT_ORDER = list(INTENT_KEYWORDS)
+_KW_STRINGS = [kw for kws in INTENT_KEYWORDS.values() for kw in kws]
+_KW_LENGTHS = np.array([len(kw) for kw in _KW_STRINGS])
+_INTENT_OFFSETS = np.cumsum([0] + [len(kws) for kws in INTENT_KEYWORDS.values()])[:-1]
+# Multi-word keywords are scored as phrases against the whole message
+_PHRASE_KWS = []
+_PHRASE_INTENT_IDX = []
+for _i, _kws in enumerate(INTENT_KEYWORDS.values()):
+    for _kw in _kws:
+        if " " in _kw:
+            _PHRASE_KWS.append(_kw)
+            _PHRASE_INTENT_IDX.append(_i)
+_PHRASE_INTENT_IDX = np.array(_PHRASE_INTENT_IDX, dtype=np.intp)
+
+# Exact-match structures for detect_intent: single-word keywords become
+# frozensets so word presence is one hash intersection; multi-word phrases
+# and >3-char substring checks keep their own much shorter tuples
+_INTENT_KW_SETS = {intent: frozenset(k for k in kws if " " not in k)
+                   for intent, kws in INTENT_KEYWORDS.items()}
+_MULTIWORD_KWS = {intent: tuple(k for k in kws if " " in k)
+                  for intent, kws in INTENT_KEYWORDS.items()}
+_SUBSTR_KWS = {intent: tuple(k for k in kws if len(k) > 3)
+               for intent, kws in INTENT_KEYWORDS.items()}
+
+# Aho-Corasick automaton over every keyword: one pass over the message finds
+# all keyword occurrences at once, instead of one substring scan per keyword.
+# Optional - the frozenset/tuple scan above remains as the fallback.
+try:
+    import ahocorasick
+
+    _KW_INTENTS = {}
+    for _intent, _kws in INTENT_KEYWORDS.items():
+        for _kw in _kws:
+            _KW_INTENTS.setdefault(_kw, []).append(_intent)
+    _KW_AUTOMATON = ahocorasick.Automaton()
+    for _kw, _intents in _KW_INTENTS.items():
+        _KW_AUTOMATON.add_word(_kw, (_kw, tuple(_intents)))
+    _KW_AUTOMATON.make_automaton()
+except ImportError:
+    _KW_AUTOMATON = None
+
+def _keyword_hits(normalized_msg, msg_words, padded_msg):
+    """Find intents with exact keyword matches and >3-char substring matches.
+
+    Returns (exact_hits, substr_hits) as sets of intent names. Uses one
+    Aho-Corasick traversal when available, otherwise the precomputed
+    frozenset/tuple scan.
+    """
+    exact_hits = set()
+    substr_hits = set()
+    if _KW_AUTOMATON is not None:
+        for end_idx, (kw, intents) in _KW_AUTOMATON.iter(padded_msg):
+            start = end_idx - len(kw) + 1
+            # Space on both sides means a whole-word (or whole-phrase) match
+            if padded_msg[start - 1] == " " and padded_msg[end_idx + 1] == " ":
+                exact_hits.update(intents)
+            elif len(kw) > 3:
+                substr_hits.update(intents)
+    else:
+        for intent in _INTENT_ORDER:
+            if msg_words & _INTENT_KW_SETS[intent] or any(
+                    f" {kw} " in padded_msg for kw in _MULTIWORD_KWS[intent]):
+                exact_hits.add(intent)
+            elif any(kw in normalized_msg for kw in _SUBSTR_KWS[intent]):
+                substr_hits.add(intent)
+    return exact_hits, substr_hits
+
+# Contractions expanded during normalization
+_CONTRACTIONS = {
+    "what's": "what is",
+    "what're": "what are",
+    "who's": "who is",
+    "where's": "where is",
+    "when's": "when is",
+    "why's": "why is",
+    "how's": "how is",
+    "it's": "it is",
+    "that's": "that is",
+    "there's": "there is",
+    "here's": "here is",
+    "i'm": "i am",
+    "you're": "you are",
+    "we're": "we are",
+    "they're": "they are",
+    "i've": "i have",
+    "you've": "you have",
+    "we've": "we have",
+    "they've": "they have",
+    "i'll": "i will",
+    "you'll": "you will",
+    "we'll": "we will",
+    "they'll": "they will",
+    "don't": "do not",
+    "doesn't": "does not",
+    "didn't": "did not",
+    "can't": "cannot",
+    "won't": "will not",
+    "isn't": "is not",
+    "aren't": "are not",
+    "wasn't": "was not",
+    "weren't": "were not",
+}
+
+# One compiled alternation so expanding contractions scans the text once
+# instead of once per contraction
+_CONTRACTION_RE = re.compile(r"\b(" + "|".join(map(re.escape, _CONTRACTIONS)) + r")\b")
+
+# Translation table mapping ASCII punctuation to spaces; str.translate is a
+# single C loop with no regex engine overhead
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in string.punctuation})
+
+@functools.lru_cache(maxsize=4096)
 def normalize_text(text):
-    """Normalize text for better NLP matching"""
+    """Normalize text for better NLP matching.
+
+    Deterministic and called on every message (often more than once for the
+    same string), so results are memoized.
+    """
     # Convert to lowercase
     text = text.lower().strip()
-    
+
+    # Expand contractions in a single scan (before punctuation stripping,
+    # while the apostrophes are still there to match)
+    text = _CONTRACTION_RE.sub(lambda m: _CONTRACTIONS[m.group(0)], text)
+
     # Remove special characters but keep spaces
-    text = re.sub(r'[^\w\s]', ' ', text)
-    
+    text = text.translate(_PUNCT_TABLE)
+
     # Remove extra spaces
     text = ' '.join(text.split())
-    
-    # Expand contractions
-    contractions = {
-        "what's": "what is",
-        "what're": "what are",
-        "who's": "who is",
-        "where's": "where is",
-        "when's": "when is",
-        "why's": "why is",
-        "how's": "how is",
-        "it's": "it is",
-        "that's": "that is",
-        "there's": "there is",
-        "here's": "here is",
-        "i'm": "i am",
-        "you're": "you are",
-        "we're": "we are",
-        "they're": "they are",
-        "i've": "i have",
-        "you've": "you have",
-        "we've": "we have",
-        "they've": "they have",
-        "i'll": "i will",
-        "you'll": "you will",
-        "we'll": "we will",
-        "they'll": "they will",
-        "don't": "do not",
-        "doesn't": "does not",
-        "didn't": "did not",
-        "can't": "cannot",
-        "won't": "will not",
-        "isn't": "is not",
-        "aren't": "are not",
-        "wasn't": "was not",
-        "weren't": "were not",
-    }
-    
-    for contraction, expansion in contractions.items():
-        text = text.replace(contraction, expansion)
-    
+
     return text
 
-def expand_synonyms(text, synonym_dict):
+# Inverted synonym lookup built once at import: each word maps straight to
+# its synonym group, so expanding a word is one dict hit instead of a scan
+# over every group. setdefault keeps the first group for words that appear
+# in several, matching the old first-match-wins scan order.
+_SYN_INDEX = {}
+for _syns in SYNONYMS.values():
+    for _syn in _syns:
+        _SYN_INDEX.setdefault(_syn, tuple(_syns))
+
+def expand_synonyms(text):
     """Expand text with synonyms for better matching"""
-    words = text.split()
     expanded_words = []
-    
-    for word in words:
-        # Check if word is in any synonym group
-        found_synonym = False
-        for key, synonyms in synonym_dict.items():
-            if word in synonyms:
-                expanded_words.extend(synonyms)
-                found_synonym = True
-                break
-        if not found_synonym:
-            expanded_words.append(word)
-    
+    for word in text.split():
+        expanded_words.extend(_SYN_INDEX.get(word, (word,)))
     return ' '.join(expanded_words)
 
-def calculate_intent_score(user_msg, intent_keywords):
-    """Calculate similarity score between user message and intent keywords"""
-    user_words = set(user_msg.split())
-    scores = []
-    
-    for keyword in intent_keywords:
-        # Direct word match
-        if keyword in user_words:
-            scores.append(100)
-        else:
-            # Fuzzy match with individual words
-            best_match = 0
-            for user_word in user_words:
-                if len(user_word) > 2 and len(keyword) > 2:
-                    similarity = fuzz.ratio(user_word, keyword)
-                    best_match = max(best_match, similarity)
-            scores.append(best_match)
-    
-    # Also check for phrase matching
-    for keyword in intent_keywords:
-        if len(keyword.split()) > 1:  # Multi-word keyword
-            similarity = fuzz.partial_ratio(user_msg, keyword)
-            scores.append(similarity)
-    
-    return max(scores) if scores else 0
+def calculate_intent_scores(user_msg):
+    """Score the message against every intent in one vectorized pass.
+
+    Returns a dict mapping each intent to its best keyword similarity.
+    The full (user_word, keyword) similarity matrix is computed by a single
+    cdist call in C, then reduced per intent with numpy, replacing the old
+    per-pair Python loops.
+    """
+    user_words = user_msg.split()
+    per_intent = np.zeros(len(_INTENT_ORDER), dtype=np.uint8)
+
+    if user_words:
+        scores = process.cdist(user_words, _KW_STRINGS, scorer=fuzz.ratio,
+                               dtype=np.uint8, workers=1)
+        # Fuzzy scores only count when both strings are longer than 2 chars;
+        # exact matches (score 100) always count.
+        word_lengths = np.array([len(w) for w in user_words])
+        eligible = (word_lengths[:, None] > 2) & (_KW_LENGTHS[None, :] > 2)
+        scores = np.where(eligible | (scores == 100), scores, 0)
+        per_intent = np.maximum.reduceat(scores.max(axis=0), _INTENT_OFFSETS)
+
+    # Phrase matching for multi-word keywords against the whole message
+    if _PHRASE_KWS:
+        phrase_scores = process.cdist([user_msg], _PHRASE_KWS, scorer=fuzz.partial_ratio,
+                                      dtype=np.uint8, workers=1)[0]
+        np.maximum.at(per_intent, _PHRASE_INTENT_IDX, phrase_scores)
+
+    return {intent: int(score) for intent, score in zip(_INTENT_ORDER, per_intent)}
 
 def fuzzy_word_in_text(word, text, threshold=70):
     """Check if a word (with fuzzy matching) exists in text"""
-    text_words = text.split()
-    for text_word in text_words:
-        if fuzz.ratio(word.lower(), text_word.lower()) >= threshold:
-            return True
-    return False
-
-# Helper to search menu items
-def search_menu(user_msg, menu_data):
+    # extractOne early-exits in C once a candidate clears the cutoff
+    return process.extractOne(word, text.split(), scorer=fuzz.ratio,
+                              score_cutoff=threshold,
+                              processor=utils.default_process) is not None
+
+# Filler words that shouldn't become search candidates when indexing
+# menu descriptions
+_DESC_STOPWORDS = frozenset({
+    "with", "and", "the", "from", "over", "your", "our", "house", "served",
+})
+
+# Prebuilt fuzzy-search structures for the menu: the raw candidate strings,
+# their default_process'd copies (so extractOne skips per-call
+# preprocessing), and the maps back to item names
+_MenuIndex = collections.namedtuple(
+    "_MenuIndex",
+    ["choices", "item_map", "desc_tokens", "desc_map",
+     "choices_processed", "desc_processed", "desc_lengths", "exact_names",
+     "item_by_name_lower"])
+
+# Build the flat candidate list and search-string -> item-name map once per
+# menu load; the menu is static so per-message rebuilding is wasted work
+def _build_menu_index(menu_data):
     all_items = []
     item_map = {} # Map search string to item name for easy lookup
-    
+    item_by_name_lower = {} # Map lowercased item name to its dict, for direct lookup after a hit
+    # Description tokens are scored separately, only when nothing in the
+    # primary candidates matches: short generic words ("rice", "iced")
+    # otherwise outscore real item names under WRatio's partial matching
+    desc_tokens = []
+    desc_map = {}
+
     for category, items in menu_data.items():
-        if not isinstance(items, list):
-            continue
         for item in items:
-            if not isinstance(item, dict) or "name" not in item:
-                continue
-            
             # Add item name
-            all_items.append(item["name"])
-            item_map[item["name"]] = item["name"]
-            
-            # Add description keywords if available
-            if "description" in item and item["description"]:
-                desc = item["description"]
-                # Add the full description as a search candidate? Maybe too long. 
-                # Instead, let's just rely on fuzzy matching against the name if the user mentions description words?
-                # Actually, let's add a combined string "name description" to candidates?
-                # Better: Add specific keywords from description? 
-                # Simple approach: Add the description to the list, but map it back to the item name
-                all_items.append(desc)
-                item_map[desc] = item["name"]
+            all_items.append(item.name)
+            item_map[item.name] = item.name
+            item_by_name_lower[item.name.lower()] = item
+
+            # Add description keywords if available. Index salient words
+            # rather than the whole prose string: fuzzy-match cost scales
+            # with candidate length, so a long description costs far more
+            # than the few tokens that actually identify the dish.
+            if item.description:
+                for token in normalize_text(item.description).split():
+                    if len(token) > 3 and token not in _DESC_STOPWORDS and token not in desc_map:
+                        desc_tokens.append(token)
+                        desc_map[token] = item.name
 
             # Include variants
-            if "variants" in item and isinstance(item["variants"], list):
-                for v in item["variants"]:
-                    if isinstance(v, dict) and "size" in v:
-                        variant_str = f"{v['size']} {item['name']}"
-                        all_items.append(variant_str)
-                        item_map[variant_str] = item["name"]
-            
-            # Include flavours
-            if "flavours" in item and isinstance(item["flavours"], list):
-                for f in item["flavours"]:
-                    if isinstance(f, dict) and "name" in f:
-                        flavour_str = f"{f['name']} {item['name']}"
-                        all_items.append(flavour_str)
-                        item_map[flavour_str] = item["name"]
-                        # Also add just the flavour name mapping to the item
-                        all_items.append(f['name'])
-                        item_map[f['name']] = item["name"]
-                    elif isinstance(f, str):
-                        flavour_str = f"{f} {item['name']}"
-                        all_items.append(flavour_str)
-                        item_map[flavour_str] = item["name"]
-                        all_items.append(f)
-                        item_map[f] = item["name"]
-    
+            for v in item.variants:
+                variant_str = f"{v.size} {item.name}"
+                all_items.append(variant_str)
+                item_map[variant_str] = item.name
+
+            # Include flavours, both combined with the item name and bare
+            for f in item.flavours:
+                flavour_str = f"{f.name} {item.name}"
+                all_items.append(flavour_str)
+                item_map[flavour_str] = item.name
+                all_items.append(f.name)
+                item_map[f.name] = item.name
+
+    desc_processed = [utils.default_process(s) for s in desc_tokens]
+    # Space-padded processed names for the exact-substring fast path in
+    # search_menu; longest first so a full item name beats a bare flavour
+    exact_names = sorted(
+        {(f" {utils.default_process(s)} ", item_map[s]) for s in all_items},
+        key=lambda pair: -len(pair[0]))
+    return _MenuIndex(
+        choices=all_items,
+        item_map=item_map,
+        desc_tokens=desc_tokens,
+        desc_map=desc_map,
+        choices_processed=[utils.default_process(s) for s in all_items],
+        desc_processed=desc_processed,
+        # Token lengths, stored for the feasibility prefilter in search_menu
+        desc_lengths=np.array([len(s) for s in desc_processed]),
+        exact_names=exact_names,
+        item_by_name_lower=item_by_name_lower,
+    )
+
+# Render the FULL MENU markdown with all categories and items. The output
+# is deterministic for a given menu, so load_data caches it and the handler
+# serves the prebuilt string.
+def _render_full_menu(menu_data, currency):
+    parts = ["🍽️ **OUR FULL MENU**\n\n"]
+
+    for category, items in menu_data.items():
+        if not items:
+            continue
+
+        category_name = category.upper().replace('_', ' ')
+        parts.append(f"📋 **{category_name}** ({len(items)} items)\n")
+        parts.append("─" * 45 + "\n")
+
+        for idx, item in enumerate(items, 1):
+            parts.append(f"{idx}. {item.name}")
+
+            # Add price info
+            if item.variants:
+                prices = [v.price for v in item.variants]
+                min_price = min(prices)
+                max_price = max(prices)
+                if len(prices) == 1:
+                    parts.append(f" — {min_price} {currency}")
+                else:
+                    parts.append(f" — {min_price}-{max_price} {currency}")
+            elif item.base_price is not None:
+                parts.append(f" — {item.base_price} {currency}")
+
+            parts.append("\n")
+
+        parts.append("\n")
+
+    parts.append("💡 Ask me about any dish for details or order now!\n")
+    return ''.join(parts)
+
+# Render the popular-items sample shown when no specific dish matched; also
+# deterministic, so load_data caches the result
+def _render_popular_items(menu_data, currency):
+    parts = ["🍽️ **Popular Items:**\n\n"]
+    sample_count = 0
+    for category, items in menu_data.items():
+        if not items:
+            continue
+        for item in items:
+            parts.append(f"• {item.name}")
+            if item.variants:
+                parts.append(f" — {min(v.price for v in item.variants)} {currency}+")
+            elif item.base_price is not None:
+                parts.append(f" — {item.base_price} {currency}")
+            parts.append("\n")
+            sample_count += 1
+            if sample_count >= 4:
+                break
+        if sample_count >= 4:
+            break
+
+    parts.append("\n💬 Say **'full menu'** to see everything!\n")
+    return ''.join(parts)
+
+_DAYS_ORDER = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+def _render_hours(hours_list):
+    """Render the opening-hours response once; no user input influences it."""
+    parts = ["🕐 **OPENING HOURS:**\n\n"]
+
+    for hours_info in hours_list:
+        parts.append(f"**{hours_info.branch_name}**\n")
+        parts.append("─" * 40 + "\n")
+
+        regular_hours = hours_info.regular
+        for day in _DAYS_ORDER:
+            if day in regular_hours:
+                parts.append(f"{day.capitalize()}: {regular_hours[day]}\n")
+
+        if hours_info.special_notes:
+            parts.append(f"\nℹ️ {hours_info.special_notes}\n")
+
+        parts.append("\n")
+
+    return ''.join(parts).strip()
+
+# Template for the single-item detail card; the optional sections are
+# rendered (or left empty) by _render_item_detail and substituted in one
+# format_map call
+_ITEM_TEMPLATE = (
+    "🍽️ **{name}**\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "{desc_block}{prices_block}{flavours_block}{addons_block}"
+)
+
+def _render_item_detail(item, currency):
+    """Render the detail card for one menu item from the prebuilt template."""
+    desc_block = f"📝 {item.description}\n\n" if item.description else ""
+
+    prices_block = ""
+    if item.variants:
+        rows = [f"  • {v.size}: {v.price} {currency}\n" for v in item.variants]
+        prices_block = "💰 **Prices:**\n" + ''.join(rows) + "\n"
+
+    flavours_block = ""
+    if item.flavours:
+        flavours_block = f"🌶️ **Flavours:** {', '.join(f.name for f in item.flavours)}\n\n"
+
+    addons_block = ""
+    if item.addons:
+        rows = [f"  • {a.name} — +{a.price} {currency}\n" for a in item.addons]
+        addons_block = "➕ **Addons:**\n" + ''.join(rows)
+
+    return _ITEM_TEMPLATE.format_map({
+        "name": item.name,
+        "desc_block": desc_block,
+        "prices_block": prices_block,
+        "flavours_block": flavours_block,
+        "addons_block": addons_block,
+    }).strip()
+
+# Helper to search menu items via the index prebuilt in load_data
+def search_menu(user_msg, data):
+    index = data.get("menu_index")
+    if index is None:
+        # Data didn't come through load_data; parse (idempotent) and build
+        # the index on the fly
+        index = _build_menu_index(_parse_menu(data.get("menu", {})))
     # Handle empty menu or no matches
-    if not all_items:
+    if not index.choices:
         return None
-    
-    try:
-        match, score = process.extractOne(user_msg, all_items)
-        if score >= 60:  # similarity threshold
-            # Return the actual item name, not the matched string (which could be a description or flavour)
-            return item_map.get(match)
-    except Exception:
-        # If extractOne fails, return None
-        pass
+
+    # Preprocess the query once; the candidate side was preprocessed at
+    # index-build time, so extractOne runs with processor=None
+    query = utils.default_process(user_msg)
+
+    # Exact-substring fast path: button clicks and literal item mentions
+    # ("Zinger Burger") skip the Levenshtein scan entirely. Padding keeps
+    # the check on word boundaries so "cola" can't hit inside "chocolate".
+    padded_query = f" {query} "
+    for padded_name, item_name in index.exact_names:
+        if padded_name in padded_query:
+            return item_name
+
+    # extractOne returns None when nothing clears the cutoff, so no try/except
+    # needed. The cutoff is tuned for rapidfuzz's WRatio, which scores higher
+    # than fuzzywuzzy's: at 60 generic words like "menu" cleared it against
+    # "Medium Classic Margherita" (60.0), while real dish queries score well
+    # above 70 ("price of zinger" -> 85.5).
+    result = process.extractOne(query, index.choices_processed, scorer=fuzz.WRatio,
+                                score_cutoff=70, processor=None)
+    if result:
+        # Return the actual item name, not the matched string (which could be a variant or flavour)
+        return index.item_map.get(index.choices[result[2]])
+
+    # Fall back to description keywords only when no name-ish candidate
+    # matched. Tokens are single words, so they are scored word-vs-word with
+    # plain ratio, which allows a length prefilter: ratio >= 60 is impossible
+    # once lengths differ by more than 40% of their sum (the InDel distance
+    # is at least the length difference). Note the primary tier above must
+    # NOT be length-filtered - WRatio's partial alignment legitimately
+    # matches short flavours against whole sentences.
+    if index.desc_tokens:
+        query_words = [w for w in query.split() if len(w) > 2]
+        if query_words:
+            qlens = np.array([len(w) for w in query_words])
+            diff = np.abs(qlens[:, None] - index.desc_lengths[None, :])
+            feasible = (diff <= 0.4 * (qlens[:, None] + index.desc_lengths[None, :])).any(axis=0)
+            if feasible.any():
+                cand_idx = np.flatnonzero(feasible)
+                scores = process.cdist(query_words,
+                                       [index.desc_processed[i] for i in cand_idx],
+                                       scorer=fuzz.ratio, dtype=np.uint8, workers=1)
+                best = scores.max(axis=0)
+                best_pos = int(best.argmax())
+                # Single short tokens need a stricter cutoff than whole names:
+                # at 60, ratio('thanks', 'hand') qualified and unrelated small
+                # talk came back as a dish card. 75 still admits close typos
+                # ('mashroom' -> 'mushroom' scores 87).
+                if best[best_pos] >= 75:
+                    return index.desc_map.get(index.desc_tokens[cand_idx[best_pos]])
     return None
 
-# Detect intent with improved NLP and flexibility
+# Detect intent with improved NLP and flexibility. Pure function of the
+# message string, and real traffic repeats the same few phrases (button
+# presses, "menu", "hi"), so repeat detections collapse to a dict lookup.
+@functools.lru_cache(maxsize=2048)
 def detect_intent(user_msg):
     # Normalize the message
     normalized_msg = normalize_text(user_msg)
-    
-    # Calculate scores for each intent
-    intent_scores = {}
-    
-    # Check each intent with improved matching
-    for intent, keywords in INTENT_KEYWORDS.items():
-        score = calculate_intent_score(normalized_msg, keywords)
-        
-        # Also check for direct keyword matches (case-insensitive)
-        for keyword in keywords:
-            # Exact word match is stronger
-            if f" {keyword} " in f" {normalized_msg} ":
-                score = max(score, 100)
-            # Check for partial phrase matches (only for longer keywords)
-            elif len(keyword) > 3 and keyword in normalized_msg:
-                 score = max(score, 90)
-        
+
+    # Fast path: a message that is exactly one known keyword needs no
+    # scoring at all
+    exact_intent = _EXACT_INTENT_MAP.get(normalized_msg)
+    if exact_intent is not None:
+        return exact_intent
+
+    return _resolve_intent(normalized_msg)
+
+def _resolve_intent(normalized_msg):
+    """Scoring-based intent resolution for an already-normalized message."""
+    # Calculate scores for each intent in one vectorized pass
+    intent_scores = calculate_intent_scores(normalized_msg)
+
+    # Boost scores for direct keyword matches; all keywords are located in
+    # one automaton pass over the message (see _keyword_hits)
+    msg_words = frozenset(normalized_msg.split())
+    padded_msg = f" {normalized_msg} "
+    exact_hits, substr_hits = _keyword_hits(normalized_msg, msg_words, padded_msg)
+    for intent in _INTENT_ORDER:
+        score = intent_scores[intent]
+        if score < 100:
+            # Exact word (or whole phrase) match is stronger
+            if intent in exact_hits:
+                score = 100
+            # Partial substring matches (only for longer keywords)
+            elif score < 90 and intent in substr_hits:
+                score = 90
         intent_scores[intent] = score
     
     # Debug print (can be removed in prod)
     # print(f"Intent scores: {intent_scores}")
 
-    # Special handling for greetings (should have high priority if detected)
-    if intent_scores.get("greeting", 0) > 80:
+    # Special handling for greetings and farewells (high priority if
+    # detected). The threshold is tuned for rapidfuzz, whose partial_ratio
+    # scores loose alignments higher than fuzzywuzzy did: e.g.
+    # partial_ratio("who are you", "see you") is 83 (fuzzywuzzy: 71), which
+    # must not read as a farewell.
+    if intent_scores.get("greeting", 0) > 85:
         return "greeting"
-    
-    # Special handling for farewells
-    if intent_scores.get("farewell", 0) > 80:
+
+    if intent_scores.get("farewell", 0) > 85:
         return "farewell"
     
     # Check for branch query
@@ -370,9 +928,21 @@ def detect_intent(user_msg):
     # Default to menu_query for short unclear messages that might be food names
     if len(normalized_msg.split()) <= 4:
         return "menu_query"
-    
+
     return "unknown"
 
+# Fast path for messages that are exactly one known keyword ("menu", "hi",
+# "bye" - the most common inputs). Each entry is computed by running the
+# keyword through the scoring-based resolution once at import, so the fast
+# path agrees with full scoring by construction - including keywords that
+# fuzzy- or phrase-collide with another intent's ("see" resolves to farewell
+# via "see you", "prices" to faq_query), and the map never needs manual
+# exclusions as the keyword lists change.
+_EXACT_INTENT_MAP = {
+    _kw: _resolve_intent(normalize_text(_kw))
+    for _kws in INTENT_KEYWORDS.values() for _kw in _kws if " " not in _kw
+}
+
 # Generate chatbot response
 def get_bot_response(user_msg, data):
     intent = detect_intent(user_msg)
@@ -392,192 +962,80 @@ def get_bot_response(user_msg, data):
             return "Sorry, the menu is currently unavailable."
         
         # Check if user wants FULL menu
-        wants_full = any(word in user_lower for word in ["full menu", "all menu", "complete menu", "entire menu", "show all", "all dishes", "all items"])
+        wants_full = any(phrase in user_lower for phrase in _FULL_MENU_PHRASES)
         
         if wants_full:
-            # Display FULL MENU with all categories and items
-            response = "🍽️ **OUR FULL MENU**\n\n"
-            
-            for category, items in menu_data.items():
-                if not isinstance(items, list) or len(items) == 0:
-                    continue
-                
-                category_name = category.upper().replace('_', ' ')
-                response += f"📋 **{category_name}** ({len(items)} items)\n"
-                response += "─" * 45 + "\n"
-                
-                for idx, item in enumerate(items, 1):
-                    if not isinstance(item, dict) or "name" not in item:
-                        continue
-                    
-                    response += f"{idx}. {item['name']}"
-                    
-                    # Add price info
-                    if "variants" in item and isinstance(item["variants"], list) and item["variants"]:
-                        prices = [v.get("price", 0) for v in item["variants"] if isinstance(v, dict) and "price" in v]
-                        if prices:
-                            min_price = min(prices)
-                            max_price = max(prices)
-                            if len(prices) == 1:
-                                response += f" — {min_price} {currency}"
-                            else:
-                                response += f" — {min_price}-{max_price} {currency}"
-                    elif "base_price" in item:
-                        response += f" — {item['base_price']} {currency}"
-                    
-                    response += "\n"
-                
-                response += "\n"
-            
-            response += "💡 Ask me about any dish for details or order now!\n"
-            return response
+            # The full menu is deterministic, so serve the copy rendered at
+            # load time when available
+            full_menu = data.get("full_menu_rendered")
+            if full_menu is None:
+                full_menu = _render_full_menu(_parse_menu(menu_data), currency)
+            return full_menu
         
-        # Search for SPECIFIC dish by name
-        match = search_menu(user_msg, menu_data)
+        # Search for SPECIFIC dish by name; detail cards are pre-rendered
+        # per item at load time
+        match = search_menu(user_msg, data)
         if match:
-            for category, items in menu_data.items():
-                if not isinstance(items, list):
-                    continue
-                for item in items:
-                    if not isinstance(item, dict) or "name" not in item:
-                        continue
-                    if match.lower() in item["name"].lower():
-                        response = f"🍽️ **{item['name']}**\n"
-                        response += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                        
-                        if item.get('description'):
-                            response += f"📝 {item['description']}\n\n"
-                        
-                        if "variants" in item and isinstance(item["variants"], list) and item["variants"]:
-                            response += "💰 **Prices:**\n"
-                            for v in item["variants"]:
-                                if isinstance(v, dict) and "size" in v and "price" in v:
-                                    response += f"  • {v['size']}: {v['price']} {currency}\n"
-                            response += "\n"
-                        
-                        if "flavours" in item and isinstance(item["flavours"], list) and item["flavours"]:
-                            flavour_list = []
-                            for f in item["flavours"]:
-                                if isinstance(f, dict) and "name" in f:
-                                    flavour_list.append(f['name'])
-                                elif isinstance(f, str):
-                                    flavour_list.append(f)
-                            if flavour_list:
-                                response += f"🌶️ **Flavours:** {', '.join(flavour_list)}\n\n"
-                        
-                        if "addons" in item and isinstance(item["addons"], list) and item["addons"]:
-                            response += "➕ **Addons:**\n"
-                            for a in item["addons"]:
-                                if isinstance(a, dict) and "name" in a and "price" in a:
-                                    response += f"  • {a['name']} — +{a['price']} {currency}\n"
-                        
-                        return response.strip()
-        
-        # If no specific match, show popular items
-        response = "🍽️ **Popular Items:**\n\n"
-        sample_count = 0
-        for category, items in menu_data.items():
-            if not isinstance(items, list) or len(items) == 0:
-                continue
-            for item in items:
-                if not isinstance(item, dict) or "name" not in item:
-                    continue
-                response += f"• {item['name']}"
-                if "variants" in item and isinstance(item["variants"], list) and item["variants"]:
-                    prices = [v.get("price", 0) for v in item["variants"] if isinstance(v, dict) and "price" in v]
-                    if prices:
-                        response += f" — {min(prices)} {currency}+"
-                elif "base_price" in item:
-                    response += f" — {item['base_price']} {currency}"
-                response += "\n"
-                sample_count += 1
-                if sample_count >= 4:
-                    break
-            if sample_count >= 4:
-                break
-        
-        response += "\n💬 Say **'full menu'** to see everything!\n"
-        return response
+            details = data.get("item_details_rendered")
+            if details is not None:
+                detail = details.get(match.lower())
+                if detail:
+                    return detail
+            else:
+                # Raw dict data without the cache: search_menu returns exact
+                # item names, so a single index lookup replaces the old
+                # nested category/item re-scan
+                index = data.get("menu_index") or _build_menu_index(_parse_menu(menu_data))
+                item = index.item_by_name_lower.get(match.lower())
+                if item is not None:
+                    return _render_item_detail(item, currency)
+
+        # If no specific match, show popular items (pre-rendered as well)
+        popular = data.get("popular_items_rendered")
+        if popular is None:
+            popular = _render_popular_items(_parse_menu(menu_data), currency)
+        return popular
 
     if intent == "branch_query":
         branches = data.get("branches", [])
         if not branches:
             return "Sorry, branch information is not available."
         
-        response = "📍 **OUR BRANCHES:**\n\n"
-        for b in branches:
-            if not isinstance(b, dict):
-                continue
-            name = b.get("name", "Unknown")
-            city = b.get("city", "")
-            address = b.get("address", "Not available")
-            phone = b.get("phone", "Not available")
-            
-            response += f"**{name}**"
-            if city:
-                response += f" ({city})"
-            response += f"\n"
-            response += f"📍 {address}\n"
-            response += f"📞 {phone}\n\n"
-        
-        return response.strip()
+        parts = ["📍 **OUR BRANCHES:**\n\n"]
+        for b in _parse_branches(branches):
+            parts.append(f"**{b.name}**")
+            if b.city:
+                parts.append(f" ({b.city})")
+            parts.append(f"\n📍 {b.address}\n📞 {b.phone}\n\n")
+
+        return ''.join(parts).strip()
 
     if intent == "hours_query":
         hours_list = data.get("hours", [])
         
         if not hours_list:
             return "Sorry, opening hours are not available."
-        
-        response = "🕐 **OPENING HOURS:**\n\n"
-        
-        for hours_info in hours_list:
-            if not isinstance(hours_info, dict):
-                continue
-            
-            branch_name = hours_info.get("branch_name", "Branch")
-            response += f"**{branch_name}**\n"
-            response += "─" * 40 + "\n"
-            
-            regular_hours = hours_info.get("regular", {})
-            if isinstance(regular_hours, dict) and regular_hours:
-                days_order = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-                for day in days_order:
-                    if day in regular_hours:
-                        day_name = day.capitalize()
-                        hours = regular_hours[day]
-                        response += f"{day_name}: {hours}\n"
-            
-            special_notes = hours_info.get("special_notes", "")
-            if special_notes:
-                response += f"\nℹ️ {special_notes}\n"
-            
-            response += "\n"
-        
-        return response.strip()
+
+        # Static per data-file version, so serve the pre-rendered copy
+        rendered = data.get("hours_rendered")
+        if rendered is not None:
+            return rendered
+        return _render_hours(_parse_hours(hours_list))
 
     if intent == "faq_query":
         faqs = data.get("faq", [])
         if not faqs:
             return "Sorry, I don't have FAQ information available."
-        
-        best_match = None
-        best_score = 0
-        
-        for q in faqs:
-            if not isinstance(q, dict):
-                continue
-            question = q.get("question", "")
-            
-            # Use token_set_ratio for better partial matching
-            score = fuzz.token_set_ratio(user_lower, question.lower())
-            
-            if score > best_score:
-                best_score = score
-                best_match = q.get("answer", "")
-        
-        if best_score > 60:  # Threshold for FAQ match
-            return best_match
-        
+
+        # Use token_set_ratio for better partial matching; extractOne scans all
+        # questions in one C-level pass and returns None below the cutoff
+        faqs = _parse_faqs(faqs)
+        questions = [q.question.lower() for q in faqs]
+        best = process.extractOne(user_lower, questions, scorer=fuzz.token_set_ratio, score_cutoff=60,
+                                  processor=utils.default_process)
+        if best:
+            return faqs[best[2]].answer
+
         return "Sorry, I don't have an answer for that. You can ask about delivery, vegetarian options, halal food, or our services."
 
     if intent == "about":
@@ -596,296 +1054,3 @@ def get_bot_response(user_msg, data):
         return response.strip()
     # Fallback for unknown intent
     return fallback
-    if intent == "menu_query":
-        general_menu_patterns = [
-            "whats on menu", "what is on menu", "what on menu", "whats on the menu",
-            "show menu", "show me menu", "show me the menu", "show the menu",
-            "list menu", "list of menu", "full menu", "all menu", "complete menu",
-            "what do you have", "what do you serve", "what do you offer",
-            "what items", "what dishes", "what food", "what are the items",
-            "menu items", "menu list", "all items", "all dishes", "all food",
-            "see menu", "view menu", "display menu", "menu please", "menu",
-            "what can i order", "what can i get", "what options", "available items",
-            "tell me menu", "give me menu", "i want to see menu", "show me your menu"
-        ]
-        
-        # Check if it matches any general menu pattern (with fuzzy matching)
-        is_general_request = False
-        best_pattern_match = 0
-        
-        for pattern in general_menu_patterns:
-            # Direct match
-            if pattern in user_lower:
-                is_general_request = True
-                break
-            # Fuzzy match
-            similarity = fuzz.partial_ratio(user_lower, pattern)
-            if similarity > 85:
-                is_general_request = True
-                break
-            best_pattern_match = max(best_pattern_match, similarity)
-        
-        # Also check for combination of keywords with fuzzy matching
-        if not is_general_request:
-            general_keywords = ["show", "what", "list", "full", "all", "complete", "entire", "display", "see", "view", "available", "tell", "give"]
-            menu_words = ["menu", "dish", "dishes", "food", "item", "items", "card", "catalog", "selection"]
-            
-            has_general_keyword = False
-            has_menu_word = False
-            
-            # Check with fuzzy matching
-            for keyword in general_keywords:
-                if fuzzy_word_in_text(keyword, user_lower, threshold=80):
-                    has_general_keyword = True
-                    break
-            
-            for word in menu_words:
-                if fuzzy_word_in_text(word, user_lower, threshold=80):
-                    has_menu_word = True
-                    break
-            
-            is_general_request = has_general_keyword and has_menu_word
-        
-        # If pattern match is very high, treat as general request
-        if best_pattern_match > 75:
-            is_general_request = True
-        
-        # If it's a general menu request OR if it's unclear but has menu-related words, show sample menu
-        if is_general_request or user_lower in ["menu", "show menu", "whats on the menu", "what is on the menu", "show me the menu"] or (len(user_lower.split()) <= 4 and any(fuzzy_word_in_text(word, user_lower, threshold=70) for word in ["menu", "dish", "food", "item"])):
-            menu_data = data.get("menu", {})
-            currency = data.get("currency", "PKR")
-            
-            if not menu_data:
-                return "Sorry, the menu is currently unavailable."
-            
-            # Show just 2 sample dishes from the first category (human-friendly, not AI-like)
-            response = "🍽️ Here are some of our popular items:\n\n"
-            
-            sample_count = 0
-            for category, items in menu_data.items():
-                if not isinstance(items, list) or len(items) == 0:
-                    continue
-                
-                for item in items:
-                    if not isinstance(item, dict) or "name" not in item:
-                        continue
-                    
-                    sample_count += 1
-                    response += f"• {item['name']}"
-                    
-                    # Show price if available
-                    if "variants" in item and isinstance(item["variants"], list) and item["variants"]:
-                        prices = [v.get("price", 0) for v in item["variants"] if isinstance(v, dict) and "price" in v]
-                        if prices:
-                            min_price = min(prices)
-                            response += f" - {min_price} {currency}"
-                    elif "base_price" in item:
-                        response += f" - {item['base_price']} {currency}"
-                    
-                    response += "\n"
-                    
-                    if sample_count >= 2:
-                        break
-                
-                if sample_count >= 2:
-                    break
-            
-            response += "\n� Ask me about a specific dish or say 'full menu' to see everything!"
-            return response
-        
-        # Otherwise, search for a specific item
-        menu_data = data.get("menu", {})
-        match = search_menu(user_msg, menu_data)
-        if match:
-            # find full details
-            for category, items in menu_data.items():
-                if not isinstance(items, list):
-                    continue
-                for item in items:
-                    if not isinstance(item, dict) or "name" not in item:
-                        continue
-                    if match.lower() in item["name"].lower():
-                        response = f"🍽️ {item['name']}\n"
-                        response += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                        if item.get('description'):
-                            response += f"📝 Description:\n{item['description']}\n\n"
-                        
-                        currency = data.get("currency", "PKR")
-                        
-                        if "variants" in item and isinstance(item["variants"], list) and item["variants"]:
-                            response += "💰 Variants & Prices:\n"
-                            for v in item["variants"]:
-                                if isinstance(v, dict) and "size" in v and "price" in v:
-                                    response += f"  • {v['size']}: {v['price']} {currency}\n"
-                            response += "\n"
-                        
-                        if "flavours" in item and isinstance(item["flavours"], list) and item["flavours"]:
-                            flavour_list = []
-                            for f in item["flavours"]:
-                                if isinstance(f, dict) and "name" in f:
-                                    flavour_list.append(f['name'])
-                                elif isinstance(f, str):
-                                    flavour_list.append(f)
-                            if flavour_list:
-                                response += f"🌶️ Available Flavours:\n  {', '.join(flavour_list)}\n\n"
-                        
-                        if "addons" in item and isinstance(item["addons"], list) and item["addons"]:
-                            addon_list = []
-                            for a in item["addons"]:
-                                if isinstance(a, dict) and "name" in a and "price" in a:
-                                    addon_list.append(f"{a['name']} (+{a['price']} {currency})")
-                            if addon_list:
-                                response += f"➕ Addons Available:\n  {', '.join(addon_list)}\n\n"
-                        
-                        return response.strip()
-        else:
-            # If we couldn't find a specific item, be helpful and suggest showing the menu
-            # Also use fuzzy matching on the entire message to see if it's close to menu-related queries
-            menu_related_phrases = [
-                "what in menu", "whats in menu", "what is in menu", "show menu", 
-                "menu items", "what do you have", "what do you serve", "what in the menu",
-                "whats on menu", "what is on menu", "what on menu"
-            ]
-            
-            # Use normalized phrases for comparison
-            normalized_phrases = [normalize_text(phrase) for phrase in menu_related_phrases]
-            
-            best_match_score = 0
-            for phrase in normalized_phrases:
-                # Use partial ratio for better matching of partial phrases
-                similarity = fuzz.partial_ratio(user_lower, phrase)
-                if similarity > best_match_score:
-                    best_match_score = similarity
-            
-            # Also check with token sort ratio (word order independent)
-            for phrase in normalized_phrases:
-                similarity = fuzz.token_sort_ratio(user_lower, phrase)
-                if similarity > best_match_score:
-                    best_match_score = similarity
-            
-            if best_match_score > 70:  # 70% similarity threshold
-                    # Treat as general menu request
-                    menu_data = data.get("menu", {})
-                    currency = data.get("currency", "PKR")
-                    
-                    if not menu_data:
-                        return "Sorry, the menu is currently unavailable."
-                    
-                    response = "🍽️ **Our Menu:**\n\n"
-                    for category, items in menu_data.items():
-                        if not isinstance(items, list):
-                            continue
-                        response += f"\n📋 **{category.upper().replace('_', ' ')}:**\n"
-                        for item in items:
-                            if not isinstance(item, dict) or "name" not in item:
-                                continue
-                            response += f"  • {item['name']}"
-                            if "variants" in item and isinstance(item["variants"], list) and item["variants"]:
-                                prices = [v.get("price", 0) for v in item["variants"] if isinstance(v, dict) and "price" in v]
-                                if prices:
-                                    min_price = min(prices)
-                                    if len(prices) == 1:
-                                        response += f" - {min_price} {currency}"
-                                    else:
-                                        response += f" - Starting from {min_price} {currency}"
-                            elif "base_price" in item:
-                                response += f" - {item['base_price']} {currency}"
-                            response += "\n"
-                    response += "\n💡 Ask me about a specific item for more details (e.g., 'Tell me about Zinger Burger')"
-                    return response
-            
-            # If no match found, return helpful error message
-            return "Sorry, I couldn't find that dish. You can ask me to 'show the menu' or 'what's in the menu' to see all available items, or specify the exact name of a dish like 'Zinger Burger' or 'Classic Margherita'."
-
-    if intent == "branch_query":
-        branches = data.get("branches", [])
-        if not branches:
-            return "Sorry, I don't have branch information available."
-        
-        response = "📍 **Our Branches:**\n\n"
-        for b in branches:
-            if not isinstance(b, dict):
-                continue
-            name = b.get("name", "Unknown Branch")
-            address = b.get("address", "Address not available")
-            phone = b.get("phone", "Phone not available")
-            city = b.get("city", "")
-            response += f"**{name}**"
-            if city:
-                response += f" ({city})"
-            response += f"\n  📍 {address}\n  📞 {phone}\n\n"
-        return response.strip()
-
-    if intent == "hours_query":
-        hours_list = data.get("hours", [])
-        
-        if not hours_list:
-            return "Sorry, I don't have opening hours information available."
-        
-        response = "🕐 **Opening Hours:**\n\n"
-        for hours_info in hours_list:
-            if not isinstance(hours_info, dict):
-                continue
-            branch_name = hours_info.get("branch_name", "Unknown Branch")
-            response += f"📍 **{branch_name}**\n"
-            
-            regular_hours = hours_info.get("regular", {})
-            if isinstance(regular_hours, dict) and regular_hours:
-                days_order = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-                for day in days_order:
-                    if day in regular_hours:
-                        day_capitalized = day.capitalize()
-                        hours = regular_hours[day]
-                        response += f"  • {day_capitalized}: {hours}\n"
-            
-            special_notes = hours_info.get("special_notes", "")
-            if special_notes:
-                response += f"  ℹ️ {special_notes}\n"
-            
-            response += "\n"
-        
-        return response.strip()
-
-    if intent == "faq_query":
-        faqs = data.get("faq", [])
-        if not faqs:
-            return "Sorry, I don't have FAQ information available."
-        
-        user_lower = user_msg.lower()
-        # Try to find matching FAQ
-        for q in faqs:
-            if not isinstance(q, dict):
-                continue
-            question = q.get("question", "").lower()
-            answer = q.get("answer", "")
-            # Check if any significant words from the question match the user's message
-            question_words = [w for w in question.split() if len(w) > 3]  # Only check words longer than 3 chars
-            if any(word in user_lower for word in question_words):
-                return answer
-        
-        # If no match found, return a helpful message
-        return "Sorry, I don't have an answer for that question. You can ask about delivery, menu items, branches, or opening hours."
-
-    if intent == "about":
-        about_data = data.get("about", {})
-        if not about_data:
-            return "Sorry, I don't have information about the restaurant."
-        
-        response = f"**{about_data.get('name', 'Restaurant')}**\n\n"
-        
-        if about_data.get("mission"):
-            response += f"**Mission:** {about_data['mission']}\n\n"
-        
-        if about_data.get("vision"):
-            response += f"**Vision:** {about_data['vision']}\n\n"
-        
-        if about_data.get("values") and isinstance(about_data["values"], list):
-            response += f"**Values:** {', '.join(about_data['values'])}\n\n"
-        
-        if about_data.get("founded"):
-            response += f"**Founded:** {about_data['founded']}\n"
-        
-        return response.strip()
-
-    # fallback
-    return fallback
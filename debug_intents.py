@@ -1,4 +1,4 @@
-from app.chatbot_logic import detect_intent, INTENT_KEYWORDS, calculate_intent_score, normalize_text
+from app.chatbot_logic import detect_intent, calculate_intent_scores, normalize_text
 
 def debug_intents():
     queries = [
@@ -16,11 +16,7 @@ def debug_intents():
         normalized = normalize_text(q)
         print(f"Normalized: '{normalized}'")
         
-        scores = {}
-        for intent, keywords in INTENT_KEYWORDS.items():
-            score = calculate_intent_score(normalized, keywords)
-            scores[intent] = score
-            
+        scores = calculate_intent_scores(normalized)
         print(f"Scores: {scores}")
         detected = detect_intent(q)
         print(f"Detected Intent: {detected}\n")